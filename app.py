@@ -1,16 +1,27 @@
-from flask import Flask, render_template, request, jsonify, send_file
+from flask import Flask, render_template, request, jsonify, send_file, url_for
 import sqlite3
 import requests
 import json
+import gzip
+import hashlib
 import azure.cognitiveservices.speech as speechsdk
 from bs4 import BeautifulSoup
 import tempfile
 import os
 import random
+import secrets
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import io
 from dotenv import load_dotenv
 
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
 # Load environment variables
 load_dotenv()
 
@@ -23,11 +34,41 @@ TRANSLATOR_KEY = os.getenv("AZURE_TRANSLATOR_KEY")
 TRANSLATOR_ENDPOINT = os.getenv("AZURE_TRANSLATOR_ENDPOINT")
 TRANSLATOR_REGION = os.getenv("AZURE_TRANSLATOR_REGION", "eastus2")
 
+# Text responses smaller than this (in bytes) are sent uncompressed
+COMPRESS_MIN_SIZE = int(os.getenv("COMPRESS_MIN_SIZE", "1024"))
+COMPRESS_MIMETYPES = {'application/json', 'application/javascript', 'text/html', 'text/css', 'text/javascript'}
+STATIC_MAX_AGE = 365 * 24 * 60 * 60
+
+# Meaning lookups (Jisho scrape + translation) run in the background and are kept for a while
+MEANINGS_PAGE_SIZE = 10
+MEANINGS_LOAD_MORE_SIZE = 15
+MEANING_LOOKUP_TTL = 10 * 60
+MEANING_LOOKUP_TIMEOUT = 60
+MEANING_LOOKUP_MAX = 100
+HTTP_TIMEOUT = 15
+
+# Session history maintenance: attempts older than the retention period are rolled up
+# into word_stats and then archived (when SESSION_ARCHIVE_PATH is set) or deleted
+SESSION_RETENTION_DAYS = int(os.getenv("SESSION_RETENTION_DAYS", "90"))
+SESSION_ARCHIVE_PATH = os.getenv("SESSION_ARCHIVE_PATH")
+MAINTENANCE_BATCH_SIZE = int(os.getenv("MAINTENANCE_BATCH_SIZE", "500"))
+MAINTENANCE_INTERVAL_HOURS = float(os.getenv("MAINTENANCE_INTERVAL_HOURS", "24"))
+MAINTENANCE_CHECK_SECONDS = 15 * 60
+MAINTENANCE_RUNS_KEPT = 30
+# Switching an existing database to incremental auto_vacuum needs a full VACUUM, which locks
+# the (audio-heavy) file for a while, so it only happens when explicitly requested
+MAINTENANCE_CONVERT_AUTO_VACUUM = os.getenv("MAINTENANCE_CONVERT_AUTO_VACUUM", "").lower() in ('1', 'true', 'yes')
+# When set, POST /api/maintenance requires this value in the X-Maintenance-Token header
+MAINTENANCE_TOKEN = os.getenv("MAINTENANCE_TOKEN")
+
 # Database initialization
 def init_db():
     conn = sqlite3.connect('kakitori.db')
     cursor = conn.cursor()
     
+    # Only takes effect on a new database; existing ones are converted by run_maintenance()
+    cursor.execute("PRAGMA auto_vacuum = INCREMENTAL")
+    
     # Create tables
     cursor.execute('''
         CREATE TABLE IF NOT EXISTS hiragana (
@@ -49,11 +90,17 @@ def init_db():
         )
     ''')
     
+    # position orders the words of the current run (NULL when not part of it);
+    # the answer columns hold the latest result for each word
     cursor.execute('''
         CREATE TABLE IF NOT EXISTS session_words (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             session_id INTEGER,
             hiragana_id INTEGER,
+            position INTEGER,
+            writing_correct BOOLEAN,
+            meaning_correct BOOLEAN,
+            answered_at DATETIME,
             FOREIGN KEY (session_id) REFERENCES sessions (id),
             FOREIGN KEY (hiragana_id) REFERENCES hiragana (id)
         )
@@ -72,9 +119,114 @@ def init_db():
         )
     ''')
     
+    migrate_session_words(cursor)
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_session_words_session
+        ON session_words (session_id, position)
+    ''')
+    
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_session_attempts_date
+        ON session_attempts (attempt_date)
+    ''')
+    
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_session_attempts_session
+        ON session_attempts (session_id, attempt_date)
+    ''')
+    
+    # Per-word totals of attempts compacted out of session_attempts
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS word_stats (
+            hiragana_id INTEGER PRIMARY KEY,
+            attempts INTEGER NOT NULL DEFAULT 0,
+            writing_correct INTEGER NOT NULL DEFAULT 0,
+            meaning_correct INTEGER NOT NULL DEFAULT 0,
+            last_attempt DATETIME,
+            FOREIGN KEY (hiragana_id) REFERENCES hiragana (id)
+        )
+    ''')
+    
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS maintenance_runs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            run_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            report TEXT
+        )
+    ''')
+    
+    # Catalog version, bumped by triggers on every change to hiragana
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS catalog_meta (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            version INTEGER NOT NULL DEFAULT 0
+        )
+    ''')
+    cursor.execute("INSERT OR IGNORE INTO catalog_meta (id, version) VALUES (1, 0)")
+    
+    for event in ('INSERT', 'UPDATE', 'DELETE'):
+        cursor.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS hiragana_catalog_{event.lower()}
+            AFTER {event} ON hiragana
+            BEGIN
+                UPDATE catalog_meta SET version = version + 1 WHERE id = 1;
+            END
+        ''')
+    
     conn.commit()
     conn.close()
 
+_db_ready = False
+_db_ready_lock = threading.Lock()
+
+def ensure_db():
+    """Run the idempotent init_db() once per process"""
+    global _db_ready
+    if _db_ready:
+        return
+    with _db_ready_lock:
+        if not _db_ready:
+            init_db()
+            _db_ready = True
+
+@app.before_request
+def ensure_db_before_request():
+    # Not only under python app.py: flask run and WSGI servers import the app directly
+    ensure_db()
+
+def migrate_session_words(cursor):
+    """Add the session state columns to databases created before they existed"""
+    cursor.execute("PRAGMA table_info(session_words)")
+    columns = {row[1] for row in cursor.fetchall()}
+    if 'position' in columns:
+        return
+    
+    for column in ('position INTEGER', 'writing_correct BOOLEAN',
+                   'meaning_correct BOOLEAN', 'answered_at DATETIME'):
+        cursor.execute(f"ALTER TABLE session_words ADD COLUMN {column}")
+    
+    # Backfill from the latest attempt of each word
+    cursor.execute('''
+        UPDATE session_words SET
+            position = id,
+            writing_correct = (
+                SELECT sa.writing_correct FROM session_attempts sa
+                WHERE sa.session_id = session_words.session_id AND sa.hiragana_id = session_words.hiragana_id
+                ORDER BY sa.id DESC LIMIT 1
+            ),
+            meaning_correct = (
+                SELECT sa.meaning_correct FROM session_attempts sa
+                WHERE sa.session_id = session_words.session_id AND sa.hiragana_id = session_words.hiragana_id
+                ORDER BY sa.id DESC LIMIT 1
+            ),
+            answered_at = (
+                SELECT sa.attempt_date FROM session_attempts sa
+                WHERE sa.session_id = session_words.session_id AND sa.hiragana_id = session_words.hiragana_id
+                ORDER BY sa.id DESC LIMIT 1
+            )
+    ''')
+    print("🔧 Tabela session_words migrada para guardar o estado das sessões")
+
 class Meaning:
     def __init__(self, word, furigana, level, kanji, text):
         self.word = word
@@ -83,61 +235,67 @@ class Meaning:
         self.kanji = kanji
         self.text = text
 
-def get_meanings(word):
-    """Scrape Jisho.org for word meanings"""
-    headers = {
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/112.0.0.0 Safari/537.36'
-    }
+JISHO_HEADERS = {
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/112.0.0.0 Safari/537.36'
+}
+
+def fetch_meanings(word):
+    """Scrape every Jisho.org result for a word and translate them in one batch"""
+    response = requests.get(f"https://jisho.org/search/{word}", headers=JISHO_HEADERS, timeout=HTTP_TIMEOUT)
+    soup = BeautifulSoup(response.content, 'html.parser')
     
-    meanings = []
-    try:
-        response = requests.get(f"https://jisho.org/search/{word}", headers=headers)
-        soup = BeautifulSoup(response.content, 'html.parser')
+    # Get all concept blocks from the main results area
+    representations = soup.select('div.concept_light.clearfix')
+    
+    print(f"🔍 Encontrados {len(representations)} resultados para '{word}' no Jisho.org")
+    
+    entries = []
+    for i, representation in enumerate(representations):
+        furigana_node = representation.select_one('span.furigana')
+        kanji_node = representation.select_one('span.text')
         
-        # Get all concept blocks (not just exact_block)
-        representations = soup.select('div.concept_light.clearfix')
+        # Try multiple selectors for meanings
+        meaning_node = (representation.select_one('span.meaning-meaning') or 
+                      representation.select_one('.meaning-wrapper .meaning-meaning') or
+                      representation.select_one('.meanings-wrapper .meaning-meaning'))
         
-        print(f"🔍 Encontrados {len(representations)} resultados para '{word}' no Jisho.org")
+        level_nodes = representation.select('span.concept_light-tag.label')
         
-        for i, representation in enumerate(representations[:10]):  # Increased to 10 results
-            furigana_node = representation.select_one('span.furigana')
-            kanji_node = representation.select_one('span.text')
-            meaning_node = representation.select_one('span.meaning-meaning')
-            level_node = representation.select_one('span.concept_light-tag.label')
-            
-            furigana = furigana_node.get_text(strip=True) if furigana_node else ""
-            kanji = kanji_node.get_text(strip=True) if kanji_node else ""
-            meaning = meaning_node.get_text(strip=True) if meaning_node else ""
-            level = "JLPT N0"
-            
-            if level_node and "JLPT" in level_node.get_text():
-                level = level_node.get_text(strip=True)
-            
-            # Skip if no meaning found
-            if not meaning:
-                continue
-                
-            print(f"  📝 Resultado {i+1}: {furigana} | {kanji} | {meaning}")
-            
-            try:
-                translated = translate_to_portuguese(meaning)
-                final_meaning = f"{meaning}/{translated}"
-            except:
-                final_meaning = meaning
+        furigana = furigana_node.get_text(strip=True) if furigana_node else ""
+        kanji = kanji_node.get_text(strip=True) if kanji_node else ""
+        meaning = meaning_node.get_text(strip=True) if meaning_node else ""
+        level = "JLPT N0"
+        
+        # Check all level nodes for JLPT
+        for level_node in level_nodes:
+            level_text = level_node.get_text(strip=True)
+            if "JLPT" in level_text:
+                level = level_text
+                break
+        
+        # Skip if no meaning found
+        if not meaning:
+            print(f"  ⚠️  Pulando resultado {i+1}: sem significado")
+            continue
             
-            meanings.append(Meaning(word, furigana, level, kanji, final_meaning))
+        print(f"  📝 Resultado {i+1}: {furigana} | {kanji} | {meaning[:50]}...")
+        entries.append((furigana, kanji, level, meaning))
     
-    except Exception as e:
-        print(f"❌ Erro ao buscar significados: {e}")
+    translations = translate_many_to_portuguese([entry[3] for entry in entries])
+    
+    meanings = [
+        Meaning(word, furigana, level, kanji, f"{meaning}/{translated}")
+        for (furigana, kanji, level, meaning), translated in zip(entries, translations)
+    ]
     
     print(f"✅ Total de {len(meanings)} significados processados para '{word}'")
     return meanings
 
-def translate_to_portuguese(text):
-    """Translate text to Portuguese using Azure Translator"""
-    if not TRANSLATOR_KEY or not TRANSLATOR_ENDPOINT:
-        return text
+def translate_many_to_portuguese(texts):
+    """Translate several texts to Portuguese in a single Azure Translator request"""
+    if not texts or not TRANSLATOR_KEY or not TRANSLATOR_ENDPOINT:
+        return list(texts)
     
     route = "/translate?api-version=3.0&from=en&to=pt-br"
     url = TRANSLATOR_ENDPOINT + route
@@ -148,14 +306,167 @@ def translate_to_portuguese(text):
         'Content-Type': 'application/json'
     }
     
-    body = [{'text': text}]
+    body = [{'text': text} for text in texts]
     
     try:
-        response = requests.post(url, headers=headers, json=body)
+        response = requests.post(url, headers=headers, json=body, timeout=HTTP_TIMEOUT)
         result = response.json()
-        return result[0]['translations'][0]['text']
+        return [item['translations'][0]['text'] for item in result]
     except:
-        return text
+        return list(texts)
+
+class MeaningLookup:
+    """Meaning lookup for one word, shared by every client token that points at it"""
+    
+    def __init__(self, word):
+        self.word = word
+        self.created = time.monotonic()
+        self.meanings = []
+        self.failed = False
+        self.done = threading.Event()
+        # Set while queued on the speculative executor; started when run inline
+        self.future = None
+        self.started = False
+        # Client tokens holding this lookup; once served to get-meanings it is never superseded
+        self.tokens = set()
+        self.served = False
+    
+    def run(self):
+        try:
+            self.meanings = fetch_meanings(self.word)
+        except Exception as e:
+            print(f"❌ Erro ao buscar significados: {e}")
+            self.failed = True
+        finally:
+            self.done.set()
+    
+    def usable(self):
+        return not self.failed and time.monotonic() - self.created < MEANING_LOOKUP_TTL
+
+# Only speculative lookups go through the executor; demand lookups run in the request
+_lookup_executor = ThreadPoolExecutor(max_workers=2)
+_lookups = {}  # lookup -> None, in creation order
+_lookups_by_word = {}
+_lookup_tokens = {}
+_lookups_lock = threading.Lock()
+
+def _prune_lookups():
+    """Drop expired lookups, then the oldest finished ones beyond MEANING_LOOKUP_MAX (lock held).
+    
+    Lookups still running are never evicted: a client may be waiting on their token.
+    """
+    for lookup in list(_lookups):
+        if lookup.done.is_set() and not lookup.usable():
+            _discard_lookup(lookup)
+    
+    for lookup in list(_lookups):
+        if len(_lookups) < MEANING_LOOKUP_MAX:
+            break
+        if lookup.done.is_set():
+            _discard_lookup(lookup)
+
+def _discard_lookup(lookup):
+    _lookups.pop(lookup, None)
+    for token in lookup.tokens:
+        _lookup_tokens.pop(token, None)
+    lookup.tokens.clear()
+    if _lookups_by_word.get(lookup.word) is lookup:
+        del _lookups_by_word[lookup.word]
+
+def _register_lookup(word):
+    lookup = MeaningLookup(word)
+    _lookups[lookup] = None
+    _lookups_by_word[word] = lookup
+    return lookup
+
+def _issue_token(lookup):
+    """Give a client its own token for a (possibly shared) lookup (lock held)"""
+    token = secrets.token_urlsafe(16)
+    _lookup_tokens[token] = lookup
+    lookup.tokens.add(token)
+    return token
+
+def _token_lookup(token, word):
+    """Return the usable lookup a token points at for this word, or None (lock held)"""
+    lookup = _lookup_tokens.get(token) if token else None
+    if lookup and lookup.word == word and lookup.usable():
+        return lookup
+    return None
+
+def supersede_meaning_lookup(token, word):
+    """Release a client's previous speculative token once it asks about a different word.
+    
+    The lookup itself is only dropped when no other client holds it and it was never served.
+    """
+    if not token:
+        return
+    with _lookups_lock:
+        lookup = _lookup_tokens.get(token)
+        if not lookup or lookup.word == word or lookup.served:
+            return
+        
+        del _lookup_tokens[token]
+        lookup.tokens.discard(token)
+        if lookup.tokens:
+            return
+        
+        # A scrape already running cannot be stopped, but a queued one is cancelled
+        if lookup.future is not None and lookup.future.cancel():
+            lookup.future = None
+            lookup.failed = True
+            lookup.done.set()
+        _discard_lookup(lookup)
+
+def start_meaning_lookup(word, token=None):
+    """Queue a speculative lookup for a word, reusing one already running or fresh.
+    
+    Returns the client's token for it (the given one if still valid), or None when the
+    table is full of unfinished lookups.
+    """
+    with _lookups_lock:
+        if _token_lookup(token, word):
+            return token
+        
+        _prune_lookups()
+        lookup = _lookups_by_word.get(word)
+        if lookup and lookup.usable():
+            return _issue_token(lookup)
+        
+        if len(_lookups) >= MEANING_LOOKUP_MAX:
+            return None
+        
+        lookup = _register_lookup(word)
+        lookup.future = _lookup_executor.submit(lookup.run)
+        token = _issue_token(lookup)
+    
+    print(f"🚀 Iniciando busca antecipada de significados para '{word}'")
+    return token
+
+def resolve_meaning_lookup(word, token=None):
+    """Return (lookup, token) for a token (or word), running the lookup inline if not started"""
+    with _lookups_lock:
+        lookup = _token_lookup(token, word)
+        if not lookup:
+            lookup = _lookups_by_word.get(word)
+            if not (lookup and lookup.usable()):
+                _prune_lookups()
+                lookup = _register_lookup(word)
+            token = _issue_token(lookup)
+        
+        # Never wait behind speculative work: take over a lookup still in the queue
+        if lookup.future is not None and lookup.future.cancel():
+            lookup.future = None
+        run_inline = lookup.future is None and not lookup.started
+        if run_inline:
+            lookup.started = True
+    
+    if run_inline:
+        lookup.run()
+    return lookup, token
+
+def discard_meaning_lookup(lookup):
+    with _lookups_lock:
+        _discard_lookup(lookup)
 
 def generate_speech(voice, text):
     """Generate speech audio using Azure Speech Service"""
@@ -183,14 +494,173 @@ def generate_speech(voice, text):
     
     return None
 
+class WordEntry:
+    """Compact in-memory record of a word's metadata (without audio blobs)"""
+    __slots__ = ('id', 'word', 'kanji', 'level', 'meaning',
+                 'has_audio1', 'has_audio2', 'has_audio3')
+    
+    def __init__(self, id, word, kanji, level, meaning, has_audio1, has_audio2, has_audio3):
+        self.id = id
+        self.word = word
+        self.kanji = kanji
+        self.level = level
+        self.meaning = meaning
+        self.has_audio1 = bool(has_audio1)
+        self.has_audio2 = bool(has_audio2)
+        self.has_audio3 = bool(has_audio3)
+    
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'word': self.word,
+            'kanji': self.kanji,
+            'level': self.level,
+            'meaning': self.meaning,
+            'has_audio1': self.has_audio1,
+            'has_audio2': self.has_audio2,
+            'has_audio3': self.has_audio3
+        }
+
+class WordCatalog:
+    """Lazily loaded in-memory catalog of word metadata.
+    
+    Write paths in this process call invalidate() after committing. Changes
+    committed by other processes are detected with PRAGMA data_version on a
+    dedicated connection; the catalog_meta version then tells whether the
+    hiragana table itself changed or only the session tables did.
+    """
+    
+    def __init__(self, db_path='kakitori.db'):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = None
+        self._data_version = None
+        self._catalog_version = None
+        self._entries = None
+        self._by_word = None
+    
+    def invalidate(self):
+        """Drop the cached catalog so the next read reloads it"""
+        with self._lock:
+            self._entries = None
+            self._by_word = None
+    
+    def get(self, word_id):
+        """Return the WordEntry for an id, or None"""
+        with self._lock:
+            self._ensure_fresh()
+            return self._entries.get(word_id)
+    
+    def get_many(self, word_ids):
+        """Return the entries for several ids from one snapshot, skipping missing ones"""
+        with self._lock:
+            self._ensure_fresh()
+            return [self._entries[word_id] for word_id in word_ids if word_id in self._entries]
+    
+    def find(self, word):
+        """Return the WordEntry for a word text, or None"""
+        with self._lock:
+            self._ensure_fresh()
+            word_id = self._by_word.get(word)
+            return self._entries[word_id] if word_id is not None else None
+    
+    def entries(self):
+        """Return all entries ordered by id"""
+        with self._lock:
+            self._ensure_fresh()
+            return list(self._entries.values())
+    
+    def version(self):
+        """Return the catalog_meta version of the loaded catalog, or None if unavailable"""
+        with self._lock:
+            self._ensure_fresh()
+            return self._catalog_version
+    
+    def _ensure_fresh(self):
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        
+        data_version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+        if self._entries is not None and data_version == self._data_version:
+            return
+        self._data_version = data_version
+        
+        catalog_version = self._read_catalog_version()
+        if (self._entries is not None and catalog_version is not None
+                and catalog_version == self._catalog_version):
+            return
+        
+        self._load(catalog_version)
+    
+    def _read_catalog_version(self):
+        try:
+            row = self._conn.execute("SELECT version FROM catalog_meta WHERE id = 1").fetchone()
+        except sqlite3.OperationalError:
+            # Database created before catalog_meta existed: reload on every change
+            return None
+        return row[0] if row else None
+    
+    def _load(self, catalog_version):
+        cursor = self._conn.execute("""
+            SELECT id, word, kanji, level, meaning,
+                   CASE WHEN audio1 IS NOT NULL THEN 1 ELSE 0 END as has_audio1,
+                   CASE WHEN audio2 IS NOT NULL THEN 1 ELSE 0 END as has_audio2,
+                   CASE WHEN audio3 IS NOT NULL THEN 1 ELSE 0 END as has_audio3
+            FROM hiragana
+            ORDER BY id
+        """)
+        
+        entries = {}
+        by_word = {}
+        for row in cursor:
+            entry = WordEntry(*row)
+            entries[entry.id] = entry
+            by_word[entry.word] = entry.id
+        
+        self._entries = entries
+        self._by_word = by_word
+        self._catalog_version = catalog_version
+        print(f"📚 Catálogo carregado com {len(entries)} palavras")
+
+word_catalog = WordCatalog()
+
+def catalog_etag(prefix):
+    """Weak ETag tied to the catalog version, or None if the version is unknown"""
+    version = word_catalog.version()
+    if version is None:
+        return None
+    return f"{prefix}-{version}"
+
+def not_modified(etag):
+    """Return a 304 response if the client already holds this ETag"""
+    if etag and request.if_none_match.contains_weak(etag):
+        return with_etag(app.response_class(status=304), etag)
+    return None
+
+def with_etag(response, etag):
+    """Attach a weak ETag and the caching headers shared by the 200 and the 304"""
+    if etag:
+        response.set_etag(etag, weak=True)
+        response.cache_control.no_cache = True
+        # The 200 may be compressed, so both must vary on the negotiated encoding
+        response.vary.add('Accept-Encoding')
+    return response
+
+_asset_hashes = {}
+
+@app.template_global()
+def asset_url(filename):
+    """URL for a static file, fingerprinted with a hash of its contents"""
+    digest = _asset_hashes.get(filename)
+    if digest is None or app.debug:
+        with open(os.path.join(app.static_folder, filename), 'rb') as f:
+            digest = hashlib.sha256(f.read()).hexdigest()[:12]
+        _asset_hashes[filename] = digest
+    return url_for('static', filename=filename, v=digest)
+
 def word_exists(word):
     """Check if word already exists in database"""
-    conn = sqlite3.connect('kakitori.db')
-    cursor = conn.cursor()
-    cursor.execute("SELECT COUNT(*) FROM hiragana WHERE word = ?", (word,))
-    count = cursor.fetchone()[0]
-    conn.close()
-    return count > 0
+    return word_catalog.find(word) is not None
 
 def add_word(kanji, level, word, meaning, audio1, audio2, audio3):
     """Add word to database"""
@@ -207,9 +677,13 @@ def add_word(kanji, level, word, meaning, audio1, audio2, audio3):
     
     conn.commit()
     conn.close()
+    word_catalog.invalidate()
 
 def get_random_words(count=5):
     """Get random words and create a new session"""
+    entries = word_catalog.entries()
+    chosen = random.sample(entries, min(count, len(entries)))
+    
     conn = sqlite3.connect('kakitori.db')
     cursor = conn.cursor()
     
@@ -217,65 +691,84 @@ def get_random_words(count=5):
     cursor.execute("INSERT INTO sessions (session_date) VALUES (datetime('now'))")
     session_id = cursor.lastrowid
     
-    # Get random words
-    cursor.execute("""
-        SELECT id, word, audio1, audio2, audio3, meaning 
-        FROM hiragana 
-        ORDER BY RANDOM() 
-        LIMIT ?
-    """, (count,))
-    
-    words = cursor.fetchall()
-    
-    # Add words to session
-    for word in words:
-        cursor.execute("""
-            INSERT INTO session_words (session_id, hiragana_id) 
-            VALUES (?, ?)
-        """, (session_id, word[0]))
+    # Add words to session in the order they will be practiced
+    cursor.executemany("""
+        INSERT INTO session_words (session_id, hiragana_id, position) 
+        VALUES (?, ?, ?)
+    """, [(session_id, entry.id, position) for position, entry in enumerate(chosen)])
     
     conn.commit()
     conn.close()
     
-    # Return words with session_id
-    return [(session_id, *word) for word in words]
+    return session_word_tuples(session_id, [entry.id for entry in chosen])
 
-def get_session_words(session_id, only_errors=False):
-    """Get words from a specific session"""
+def session_word_tuples(session_id, word_ids):
+    """Build (session_id, id, word, meaning) tuples from the catalog, skipping deleted words"""
+    return [(session_id, entry.id, entry.word, entry.meaning)
+            for entry in word_catalog.get_many(word_ids)]
+
+def restart_session(session_id, only_errors=False):
+    """Start a new, reshuffled run over a session's words (or only the ones answered wrong)"""
     conn = sqlite3.connect('kakitori.db')
     cursor = conn.cursor()
     
     error_condition = ""
     if only_errors:
-        error_condition = """
-            AND EXISTS (
-                SELECT 1 FROM session_attempts sa
-                WHERE sa.session_id = sw.session_id 
-                AND sa.hiragana_id = h.id
-                AND (sa.writing_correct = 0 OR sa.meaning_correct = 0)
-            )
-        """
+        error_condition = "AND (writing_correct = 0 OR meaning_correct = 0)"
     
-    query = f"""
-        SELECT sw.session_id, h.id, h.word, h.audio1, h.audio2, h.audio3, h.meaning 
-        FROM session_words sw
-        JOIN hiragana h ON sw.hiragana_id = h.id
-        WHERE sw.session_id = ?
+    cursor.execute(f"""
+        SELECT hiragana_id FROM session_words
+        WHERE session_id = ?
         {error_condition}
-        ORDER BY RANDOM()
-    """
+    """, (session_id,))
+    word_ids = [row[0] for row in cursor.fetchall()]
+    random.shuffle(word_ids)
+    
+    if word_ids:
+        # Words left out of the run keep their previous answers for the score
+        cursor.execute("UPDATE session_words SET position = NULL WHERE session_id = ?", (session_id,))
+        cursor.executemany("""
+            UPDATE session_words
+            SET position = ?, writing_correct = NULL, meaning_correct = NULL, answered_at = NULL
+            WHERE session_id = ? AND hiragana_id = ?
+        """, [(position, session_id, word_id) for position, word_id in enumerate(word_ids)])
+        conn.commit()
     
-    cursor.execute(query, (session_id,))
-    words = cursor.fetchall()
     conn.close()
     
-    return words
+    return session_word_tuples(session_id, word_ids)
+
+def get_session_progress(session_id):
+    """Return (remaining words, cursor, total) for the current run of a session, or None"""
+    conn = sqlite3.connect('kakitori.db')
+    cursor = conn.cursor()
+    
+    cursor.execute("""
+        SELECT hiragana_id, answered_at IS NOT NULL
+        FROM session_words
+        WHERE session_id = ? AND position IS NOT NULL
+        ORDER BY position
+    """, (session_id,))
+    rows = cursor.fetchall()
+    conn.close()
+    
+    if not rows:
+        return None
+    
+    remaining = [word_id for word_id, answered in rows if not answered]
+    return session_word_tuples(session_id, remaining), len(rows) - len(remaining), len(rows)
 
 def insert_attempt(session_id, hiragana_id, writing_correct, meaning_correct):
-    """Record attempt results"""
+    """Record attempt results in the session state and the attempt history"""
     conn = sqlite3.connect('kakitori.db')
     cursor = conn.cursor()
     
+    cursor.execute("""
+        UPDATE session_words
+        SET writing_correct = ?, meaning_correct = ?, answered_at = datetime('now')
+        WHERE session_id = ? AND hiragana_id = ?
+    """, (writing_correct, meaning_correct, session_id, hiragana_id))
+    
     cursor.execute("""
         INSERT INTO session_attempts (session_id, hiragana_id, attempt_date, writing_correct, meaning_correct)
         VALUES (?, ?, datetime('now'), ?, ?)
@@ -289,31 +782,329 @@ def calculate_session_score(session_id):
     conn = sqlite3.connect('kakitori.db')
     cursor = conn.cursor()
     
-    # Total words in session
-    cursor.execute("SELECT COUNT(*) FROM session_words WHERE session_id = ?", (session_id,))
-    total_words = cursor.fetchone()[0]
-    
-    # Correct attempts
+    # Total words in session and words answered fully correct
     cursor.execute("""
-        SELECT COUNT(*) FROM session_attempts 
-        WHERE session_id = ? AND writing_correct = 1 AND meaning_correct = 1
+        SELECT COUNT(*), COALESCE(SUM(writing_correct = 1 AND meaning_correct = 1), 0)
+        FROM session_words WHERE session_id = ?
     """, (session_id,))
-    correct_attempts = cursor.fetchone()[0]
+    total_words, correct_words = cursor.fetchone()
     
     conn.close()
     
     if total_words == 0:
         return 0
     
-    return round((correct_attempts / total_words) * 10, 2)
+    return round((correct_words / total_words) * 10, 2)
+
+# Session history maintenance
+SESSION_HISTORY_COLUMNS = {
+    'sessions': 'id, session_date',
+    'session_words': 'id, session_id, hiragana_id, position, writing_correct, meaning_correct, answered_at',
+    'session_attempts': 'id, session_id, hiragana_id, attempt_date, writing_correct, meaning_correct'
+}
+REPORT_TABLES = ('hiragana', 'sessions', 'session_words', 'session_attempts', 'word_stats')
+
+_maintenance_lock = threading.Lock()
+
+def _placeholders(ids):
+    return ','.join('?' * len(ids))
+
+def _move_rows(cursor, table, ids, archive):
+    """Delete rows by id, copying them to the attached archive database first"""
+    if not ids:
+        return
+    if archive:
+        columns = SESSION_HISTORY_COLUMNS[table]
+        cursor.execute(f"""
+            INSERT INTO archive.{table} ({columns})
+            SELECT {columns} FROM main.{table} WHERE id IN ({_placeholders(ids)})
+        """, ids)
+    cursor.execute(f"DELETE FROM main.{table} WHERE id IN ({_placeholders(ids)})", ids)
+
+def _compact_attempts(cursor, attempt_ids, archive):
+    """Add attempts to the per-word totals in word_stats, then move them out"""
+    if not attempt_ids:
+        return
+    cursor.execute(f"""
+        INSERT INTO word_stats (hiragana_id, attempts, writing_correct, meaning_correct, last_attempt)
+        SELECT hiragana_id, COUNT(*),
+               COUNT(CASE WHEN writing_correct = 1 THEN 1 END),
+               COUNT(CASE WHEN meaning_correct = 1 THEN 1 END),
+               MAX(attempt_date)
+        FROM session_attempts
+        WHERE id IN ({_placeholders(attempt_ids)}) AND hiragana_id IS NOT NULL
+        GROUP BY hiragana_id
+        ON CONFLICT (hiragana_id) DO UPDATE SET
+            attempts = attempts + excluded.attempts,
+            writing_correct = writing_correct + excluded.writing_correct,
+            meaning_correct = meaning_correct + excluded.meaning_correct,
+            last_attempt = MAX(COALESCE(last_attempt, ''), excluded.last_attempt)
+    """, attempt_ids)
+    _move_rows(cursor, 'session_attempts', attempt_ids, archive)
+
+def _run_batches(cursor, step):
+    """Run step() in its own write transaction until it handles less than a full batch"""
+    total = 0
+    while True:
+        cursor.execute("BEGIN IMMEDIATE")
+        try:
+            count = step()
+            cursor.execute("COMMIT")
+        except Exception:
+            cursor.execute("ROLLBACK")
+            raise
+        total += count
+        if count < MAINTENANCE_BATCH_SIZE:
+            return total
+
+def database_report(cursor):
+    """Database file size, free space and per-table row counts and sizes"""
+    page_size = cursor.execute("PRAGMA page_size").fetchone()[0]
+    page_count = cursor.execute("PRAGMA page_count").fetchone()[0]
+    freelist_count = cursor.execute("PRAGMA freelist_count").fetchone()[0]
+    
+    # dbstat is only available when SQLite is compiled with SQLITE_ENABLE_DBSTAT_VTAB
+    try:
+        cursor.execute("SELECT name, SUM(pgsize) FROM dbstat GROUP BY name")
+        table_bytes = dict(cursor.fetchall())
+    except sqlite3.OperationalError:
+        table_bytes = {}
+    
+    tables = {}
+    for table in REPORT_TABLES:
+        rows = cursor.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+        tables[table] = {'rows': rows, 'bytes': table_bytes.get(table)}
+    
+    return {
+        'database_bytes': page_size * page_count,
+        'free_bytes': page_size * freelist_count,
+        'tables': tables
+    }
+
+def run_maintenance(convert_auto_vacuum=MAINTENANCE_CONVERT_AUTO_VACUUM):
+    """Compact old session history, reclaim free pages and refresh query planner statistics"""
+    started = time.monotonic()
+    archive = bool(SESSION_ARCHIVE_PATH)
+    batch = MAINTENANCE_BATCH_SIZE
+    
+    conn = sqlite3.connect('kakitori.db', isolation_level=None, timeout=30)
+    cursor = conn.cursor()
+    
+    try:
+        if archive:
+            cursor.execute("ATTACH DATABASE ? AS archive", (SESSION_ARCHIVE_PATH,))
+            for table, columns in SESSION_HISTORY_COLUMNS.items():
+                cursor.execute(f"CREATE TABLE IF NOT EXISTS archive.{table} AS SELECT {columns} FROM main.{table} WHERE 0")
+        
+        size_before = database_report(cursor)['database_bytes']
+        cutoff = cursor.execute("SELECT datetime('now', ?)", (f'-{SESSION_RETENTION_DAYS} days',)).fetchone()[0]
+        
+        def compact_old_attempts():
+            cursor.execute("""
+                SELECT id FROM session_attempts
+                WHERE attempt_date < ?
+                ORDER BY id LIMIT ?
+            """, (cutoff, batch))
+            attempt_ids = [row[0] for row in cursor.fetchall()]
+            _compact_attempts(cursor, attempt_ids, archive)
+            return len(attempt_ids)
+        
+        def remove_old_sessions():
+            # Sessions practiced recently are kept even if they were created long ago.
+            # answered_at is cleared when a session is repeated, so attempts count too
+            cursor.execute("""
+                SELECT s.id FROM sessions s
+                WHERE s.session_date < ?
+                AND NOT EXISTS (
+                    SELECT 1 FROM session_words sw
+                    WHERE sw.session_id = s.id AND sw.answered_at >= ?
+                )
+                AND NOT EXISTS (
+                    SELECT 1 FROM session_attempts sa
+                    WHERE sa.session_id = s.id AND sa.attempt_date >= ?
+                )
+                ORDER BY s.id LIMIT ?
+            """, (cutoff, cutoff, cutoff, batch))
+            session_ids = [row[0] for row in cursor.fetchall()]
+            if not session_ids:
+                return 0
+            
+            cursor.execute(f"SELECT id FROM session_attempts WHERE session_id IN ({_placeholders(session_ids)})", session_ids)
+            _compact_attempts(cursor, [row[0] for row in cursor.fetchall()], archive)
+            
+            cursor.execute(f"SELECT id FROM session_words WHERE session_id IN ({_placeholders(session_ids)})", session_ids)
+            _move_rows(cursor, 'session_words', [row[0] for row in cursor.fetchall()], archive)
+            
+            _move_rows(cursor, 'sessions', session_ids, archive)
+            return len(session_ids)
+        
+        attempts_compacted = _run_batches(cursor, compact_old_attempts)
+        sessions_removed = _run_batches(cursor, remove_old_sessions)
+        
+        # Refresh statistics fully after large deletions, otherwise let SQLite decide
+        if attempts_compacted or sessions_removed:
+            cursor.execute("ANALYZE")
+        cursor.execute("PRAGMA optimize")
+        
+        # Databases created before auto_vacuum was enabled need one full VACUUM to switch
+        converted = False
+        auto_vacuum = cursor.execute("PRAGMA auto_vacuum").fetchone()[0]
+        if auto_vacuum != 2 and convert_auto_vacuum:
+            print(f"🔧 Convertendo banco para auto_vacuum incremental: VACUUM completo de "
+                  f"{size_before} bytes, o banco ficará bloqueado até o fim")
+            cursor.execute("PRAGMA auto_vacuum = INCREMENTAL")
+            cursor.execute("VACUUM")
+            auto_vacuum = cursor.execute("PRAGMA auto_vacuum").fetchone()[0]
+            converted = True
+            print("🔧 Conversão para auto_vacuum incremental concluída")
+        elif auto_vacuum != 2:
+            print("⚠️  Banco sem auto_vacuum incremental: o espaço livre não será devolvido. "
+                  "Use MAINTENANCE_CONVERT_AUTO_VACUUM=1 ou POST /api/maintenance "
+                  "com {\"convert_auto_vacuum\": true} para converter (VACUUM completo)")
+        
+        if auto_vacuum == 2:
+            # incremental_vacuum frees one page per step; executescript runs it to completion
+            cursor.executescript("PRAGMA incremental_vacuum;")
+        
+        report = database_report(cursor)
+        report.update({
+            'run_at': datetime.now().isoformat(timespec='seconds'),
+            'retention_days': SESSION_RETENTION_DAYS,
+            'archived': archive,
+            'attempts_compacted': attempts_compacted,
+            'sessions_removed': sessions_removed,
+            'reclaimed_bytes': max(size_before - report['database_bytes'], 0),
+            'auto_vacuum': {0: 'none', 1: 'full', 2: 'incremental'}.get(auto_vacuum, auto_vacuum),
+            'auto_vacuum_converted': converted,
+            'duration_seconds': round(time.monotonic() - started, 2)
+        })
+        
+        cursor.execute("INSERT INTO maintenance_runs (report) VALUES (?)", (json.dumps(report),))
+        cursor.execute("""
+            DELETE FROM maintenance_runs
+            WHERE id NOT IN (SELECT id FROM maintenance_runs ORDER BY id DESC LIMIT ?)
+        """, (MAINTENANCE_RUNS_KEPT,))
+    finally:
+        conn.close()
+    
+    print(f"🧹 Manutenção concluída: {attempts_compacted} tentativas compactadas, "
+          f"{sessions_removed} sessões removidas, {report['reclaimed_bytes']} bytes recuperados")
+    return report
+
+def start_maintenance_job(convert_auto_vacuum=MAINTENANCE_CONVERT_AUTO_VACUUM):
+    """Run maintenance in a new background thread; False if a run is already in progress"""
+    if not _maintenance_lock.acquire(blocking=False):
+        return False
+    
+    def job():
+        try:
+            run_maintenance(convert_auto_vacuum)
+        except Exception as e:
+            print(f"❌ Erro na manutenção: {e}")
+        finally:
+            _maintenance_lock.release()
+    
+    threading.Thread(target=job, name='maintenance-job', daemon=True).start()
+    return True
 
-def delete_session_attempts(session_id):
-    """Delete all attempts for a session"""
+def last_maintenance_report():
+    """Return the report of the most recent maintenance run, or None"""
     conn = sqlite3.connect('kakitori.db')
     cursor = conn.cursor()
-    cursor.execute("DELETE FROM session_attempts WHERE session_id = ?", (session_id,))
-    conn.commit()
+    cursor.execute("SELECT report FROM maintenance_runs ORDER BY id DESC LIMIT 1")
+    row = cursor.fetchone()
+    conn.close()
+    return json.loads(row[0]) if row else None
+
+def maintenance_due():
+    """Check whether the last maintenance run (from any process) is older than the interval"""
+    conn = sqlite3.connect('kakitori.db')
+    cursor = conn.cursor()
+    cursor.execute("""
+        SELECT COALESCE(MAX(run_at) < datetime('now', ?), 1) FROM maintenance_runs
+    """, (f'-{MAINTENANCE_INTERVAL_HOURS} hours',))
+    due = bool(cursor.fetchone()[0])
     conn.close()
+    return due
+
+_scheduler_started = False
+_scheduler_lock = threading.Lock()
+
+def start_maintenance_scheduler():
+    """Run maintenance in a background thread whenever it is due (once per process)"""
+    global _scheduler_started
+    with _scheduler_lock:
+        if _scheduler_started:
+            return
+        _scheduler_started = True
+    
+    if MAINTENANCE_INTERVAL_HOURS <= 0:
+        print("ℹ️  Manutenção agendada desativada (MAINTENANCE_INTERVAL_HOURS=0)")
+        return
+    
+    # maintenance_runs and word_stats are created by init_db()
+    ensure_db()
+    
+    def loop():
+        while True:
+            try:
+                if maintenance_due() and _maintenance_lock.acquire(blocking=False):
+                    try:
+                        run_maintenance()
+                    finally:
+                        _maintenance_lock.release()
+            except Exception as e:
+                print(f"❌ Erro na manutenção: {e}")
+            time.sleep(MAINTENANCE_CHECK_SECONDS)
+    
+    threading.Thread(target=loop, name='maintenance', daemon=True).start()
+    print(f"🗓️  Manutenção agendada a cada {MAINTENANCE_INTERVAL_HOURS} horas (pid {os.getpid()})")
+
+@app.before_request
+def ensure_maintenance_scheduler():
+    # Started lazily so it runs in every serving process, however the app is launched
+    if not _scheduler_started:
+        start_maintenance_scheduler()
+
+@app.after_request
+def optimize_response(response):
+    """Far-future caching for fingerprinted assets and gzip/brotli for text responses"""
+    if request.endpoint == 'static' and 'v' in request.args and response.status_code in (200, 304):
+        response.cache_control.no_cache = None
+        response.cache_control.public = True
+        response.cache_control.max_age = STATIC_MAX_AGE
+        response.cache_control.immutable = True
+    
+    if (response.status_code != 200
+            or response.mimetype not in COMPRESS_MIMETYPES
+            or 'Content-Encoding' in response.headers):
+        return response
+    
+    response.vary.add('Accept-Encoding')
+    
+    encoding = request.accept_encodings.best_match(['br', 'gzip'] if brotli else ['gzip'])
+    if not encoding:
+        return response
+    
+    response.direct_passthrough = False
+    data = response.get_data()
+    if len(data) < COMPRESS_MIN_SIZE:
+        return response
+    
+    if encoding == 'br':
+        data = brotli.compress(data, quality=5)
+    else:
+        data = gzip.compress(data, compresslevel=6)
+    
+    response.set_data(data)
+    response.headers['Content-Encoding'] = encoding
+    
+    # Compressed bytes differ from the original, so a strong ETag becomes weak
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        response.set_etag(etag, weak=True)
+    
+    return response
 
 # Routes
 @app.route('/')
@@ -341,6 +1132,34 @@ def api_status():
     }
     return jsonify(status)
 
+@app.route('/api/maintenance', methods=['GET'])
+def maintenance_status():
+    """Report of the last maintenance run and the current table sizes"""
+    conn = sqlite3.connect('kakitori.db')
+    database = database_report(conn.cursor())
+    conn.close()
+    
+    return jsonify({
+        'running': _maintenance_lock.locked(),
+        'last_run': last_maintenance_report(),
+        'database': database
+    })
+
+@app.route('/api/maintenance', methods=['POST'])
+def maintenance_run():
+    """Start a maintenance run in the background"""
+    if MAINTENANCE_TOKEN and not secrets.compare_digest(
+            request.headers.get('X-Maintenance-Token', ''), MAINTENANCE_TOKEN):
+        return jsonify({'error': 'Invalid maintenance token'}), 403
+    
+    data = request.get_json(silent=True) or {}
+    convert_auto_vacuum = bool(data.get('convert_auto_vacuum')) or MAINTENANCE_CONVERT_AUTO_VACUUM
+    
+    if not start_maintenance_job(convert_auto_vacuum):
+        return jsonify({'error': 'Maintenance already running'}), 409
+    
+    return jsonify({'status': 'started', 'convert_auto_vacuum': convert_auto_vacuum}), 202
+
 @app.route('/api/words', methods=['GET'])
 def get_words():
     """Get all words with pagination and search"""
@@ -348,6 +1167,13 @@ def get_words():
     per_page = request.args.get('per_page', 10, type=int)
     search = request.args.get('search', '')
     
+    # Read the version before querying: a concurrent write can then only leave the ETag
+    # older than the body, never the other way round
+    etag = catalog_etag('words')
+    cached = not_modified(etag)
+    if cached:
+        return cached
+    
     conn = sqlite3.connect('kakitori.db')
     cursor = conn.cursor()
     
@@ -396,44 +1222,28 @@ def get_words():
             'has_audio3': bool(word[7])
         })
     
-    return jsonify({
+    return with_etag(jsonify({
         'words': words_list,
         'total': total_count,
         'page': page,
         'per_page': per_page,
         'pages': (total_count + per_page - 1) // per_page
-    })
+    }), etag)
 
 @app.route('/api/words/<int:word_id>', methods=['GET'])
 def get_word(word_id):
     """Get specific word details"""
-    conn = sqlite3.connect('kakitori.db')
-    cursor = conn.cursor()
+    etag = catalog_etag(f'word-{word_id}')
+    cached = not_modified(etag)
+    if cached:
+        return cached
     
-    cursor.execute("""
-        SELECT id, word, kanji, level, meaning,
-               CASE WHEN audio1 IS NOT NULL THEN 1 ELSE 0 END as has_audio1,
-               CASE WHEN audio2 IS NOT NULL THEN 1 ELSE 0 END as has_audio2,
-               CASE WHEN audio3 IS NOT NULL THEN 1 ELSE 0 END as has_audio3
-        FROM hiragana WHERE id = ?
-    """, (word_id,))
+    entry = word_catalog.get(word_id)
     
-    word = cursor.fetchone()
-    conn.close()
-    
-    if not word:
+    if not entry:
         return jsonify({'error': 'Word not found'}), 404
     
-    return jsonify({
-        'id': word[0],
-        'word': word[1],
-        'kanji': word[2],
-        'level': word[3],
-        'meaning': word[4],
-        'has_audio1': bool(word[5]),
-        'has_audio2': bool(word[6]),
-        'has_audio3': bool(word[7])
-    })
+    return with_etag(jsonify(entry.to_dict()), etag)
 
 @app.route('/api/words/<int:word_id>', methods=['PUT'])
 def update_word(word_id):
@@ -458,6 +1268,7 @@ def update_word(word_id):
     
     conn.commit()
     conn.close()
+    word_catalog.invalidate()
     
     return jsonify({'success': True, 'message': 'Word updated successfully'})
 
@@ -482,12 +1293,14 @@ def delete_word(word_id):
         
         # Delete from session_words
         cursor.execute("DELETE FROM session_words WHERE hiragana_id = ?", (word_id,))
+        cursor.execute("DELETE FROM word_stats WHERE hiragana_id = ?", (word_id,))
         
         # Delete the word
         cursor.execute("DELETE FROM hiragana WHERE id = ?", (word_id,))
         
         conn.commit()
         conn.close()
+        word_catalog.invalidate()
         
         return jsonify({'success': True, 'message': f'Word "{word_text}" deleted successfully'})
         
@@ -545,6 +1358,7 @@ def regenerate_audio(word_id):
     
     conn.commit()
     conn.close()
+    word_catalog.invalidate()
     
     return jsonify({'success': True, 'message': 'Audio regenerated successfully'})
 
@@ -552,17 +1366,36 @@ def regenerate_audio(word_id):
 def check_word():
     word = request.json.get('word', '')
     exists = word_exists(word)
-    return jsonify({'exists': exists})
+    
+    # Each client keeps at most one speculative lookup
+    supersede_meaning_lookup(request.json.get('lookup_token'), word)
+    
+    response = {'exists': exists}
+    if word and not exists:
+        # Start scraping right away so get-meanings usually finds the result ready
+        token = start_meaning_lookup(word, request.json.get('lookup_token'))
+        if token:
+            response['lookup_token'] = token
+    
+    return jsonify(response)
 
 @app.route('/api/get-meanings', methods=['POST'])
 def api_get_meanings():
     word = request.json.get('word', '')
     load_more = request.json.get('load_more', False)
     
-    meanings = get_meanings_extended(word, limit=15 if load_more else 10)
+    lookup, token = resolve_meaning_lookup(word, request.json.get('lookup_token'))
+    if not lookup.done.wait(MEANING_LOOKUP_TIMEOUT):
+        return jsonify({'error': 'Tempo esgotado ao buscar significados'}), 504
+    
+    # meaning_index values now refer to this result, so it must outlive later supersedes
+    lookup.served = True
+    
+    # The full result set is parsed once; pages are slices of it
+    limit = MEANINGS_LOAD_MORE_SIZE if load_more else MEANINGS_PAGE_SIZE
     
     meanings_data = []
-    for i, meaning in enumerate(meanings):
+    for i, meaning in enumerate(lookup.meanings[:limit]):
         meanings_data.append({
             'index': i,
             'word': meaning.word,
@@ -574,70 +1407,10 @@ def api_get_meanings():
     
     return jsonify({
         'meanings': meanings_data,
-        'has_more': len(meanings) >= (10 if not load_more else 15)
+        'has_more': len(lookup.meanings) > limit,
+        'lookup_token': token
     })
 
-def get_meanings_extended(word, limit=10):
-    """Extended scraping with more results"""
-    headers = {
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/112.0.0.0 Safari/537.36'
-    }
-    
-    meanings = []
-    try:
-        response = requests.get(f"https://jisho.org/search/{word}", headers=headers)
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        # Get all concept blocks from the main results area
-        representations = soup.select('div.concept_light.clearfix')
-        
-        print(f"🔍 Encontrados {len(representations)} resultados para '{word}' no Jisho.org")
-        
-        for i, representation in enumerate(representations[:limit]):
-            furigana_node = representation.select_one('span.furigana')
-            kanji_node = representation.select_one('span.text')
-            
-            # Try multiple selectors for meanings
-            meaning_node = (representation.select_one('span.meaning-meaning') or 
-                          representation.select_one('.meaning-wrapper .meaning-meaning') or
-                          representation.select_one('.meanings-wrapper .meaning-meaning'))
-            
-            level_nodes = representation.select('span.concept_light-tag.label')
-            
-            furigana = furigana_node.get_text(strip=True) if furigana_node else ""
-            kanji = kanji_node.get_text(strip=True) if kanji_node else ""
-            meaning = meaning_node.get_text(strip=True) if meaning_node else ""
-            level = "JLPT N0"
-            
-            # Check all level nodes for JLPT
-            for level_node in level_nodes:
-                level_text = level_node.get_text(strip=True)
-                if "JLPT" in level_text:
-                    level = level_text
-                    break
-            
-            # Skip if no meaning found
-            if not meaning:
-                print(f"  ⚠️  Pulando resultado {i+1}: sem significado")
-                continue
-                
-            print(f"  📝 Resultado {i+1}: {furigana} | {kanji} | {meaning[:50]}...")
-            
-            try:
-                translated = translate_to_portuguese(meaning)
-                final_meaning = f"{meaning}/{translated}"
-            except:
-                final_meaning = meaning
-            
-            meanings.append(Meaning(word, furigana, level, kanji, final_meaning))
-    
-    except Exception as e:
-        print(f"❌ Erro ao buscar significados: {e}")
-    
-    print(f"✅ Total de {len(meanings)} significados processados para '{word}'")
-    return meanings
-
 @app.route('/api/save-word', methods=['POST'])
 def save_word():
     data = request.json
@@ -646,16 +1419,20 @@ def save_word():
     use_kanji = data.get('use_kanji', False)
     custom_translation = data.get('custom_translation')
     
-    # Get meanings again (in production, you'd cache this)
-    meanings = get_meanings(word)
+    # Reuse the lookup the meanings were listed from
+    lookup, _ = resolve_meaning_lookup(word, data.get('lookup_token'))
+    if not lookup.done.wait(MEANING_LOOKUP_TIMEOUT):
+        return jsonify({'error': 'Tempo esgotado ao buscar significados'}), 504
     
-    if meaning_index >= len(meanings):
-        return jsonify({'error': 'Invalid meaning index'}), 400
+    meanings = lookup.meanings
     
-    meaning = meanings[meaning_index]
+    if meaning_index is None or meaning_index >= len(meanings):
+        return jsonify({'error': 'Invalid meaning index'}), 400
     
-    if custom_translation:
-        meaning.text = custom_translation
+    # Copy so a custom translation does not leak into the shared lookup
+    selected = meanings[meaning_index]
+    meaning = Meaning(selected.word, selected.furigana, selected.level, selected.kanji,
+                      custom_translation or selected.text)
     
     # Check Azure credentials
     if not SPEECH_KEY:
@@ -682,41 +1459,53 @@ def save_word():
     
     try:
         add_word(meaning.kanji, meaning.level, meaning.word, meaning.text, audio1, audio2, audio3)
+        discard_meaning_lookup(lookup)
         return jsonify({'success': True, 'message': 'Palavra adicionada com sucesso!'})
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+def format_practice_words(words):
+    """Format (session_id, id, word, meaning) tuples for the frontend"""
+    return [
+        {'session_id': word[0], 'id': word[1], 'word': word[2], 'meaning': word[3]}
+        for word in words
+    ]
+
 @app.route('/api/start-practice', methods=['POST'])
 def start_practice():
     data = request.json
     session_id = data.get('session_id')
     word_count = data.get('word_count', 5)
+    only_errors = data.get('only_errors', False)
     
     if session_id:
-        words = get_session_words(session_id)
+        words = restart_session(session_id, only_errors)
     else:
         words = get_random_words(word_count)
     
     if not words:
         return jsonify({'error': 'No words found'}), 404
     
-    # Clear previous attempts
-    actual_session_id = words[0][0]
-    delete_session_attempts(actual_session_id)
-    
-    # Format words for frontend
-    formatted_words = []
-    for word in words:
-        formatted_words.append({
-            'session_id': word[0],
-            'id': word[1],
-            'word': word[2],
-            'meaning': word[6]
-        })
-    
     return jsonify({
-        'session_id': actual_session_id,
-        'words': formatted_words
+        'session_id': words[0][0],
+        'words': format_practice_words(words),
+        'cursor': 0,
+        'total': len(words)
+    })
+
+@app.route('/api/resume-practice/<int:session_id>')
+def resume_practice(session_id):
+    """Return the words still to be answered in the current run of a session"""
+    progress = get_session_progress(session_id)
+    if progress is None:
+        return jsonify({'error': 'Session not found'}), 404
+    
+    words, cursor, total = progress
+    return jsonify({
+        'session_id': session_id,
+        'words': format_practice_words(words),
+        'cursor': cursor,
+        'total': total
     })
 
 @app.route('/api/audio/<int:word_id>/<int:audio_num>')
@@ -768,5 +1557,5 @@ def get_session_score(session_id):
     return jsonify({'score': score})
 
 if __name__ == '__main__':
-    init_db()
+    ensure_db()
     app.run(debug=True)
\ No newline at end of file
@@ -0,0 +1,252 @@
+let selectedMeaning = null;
+let meanings = [];
+let lookupToken = null;
+let lookupWord = null;
+let typingTimer = null;
+
+const PREFETCH_DELAY = 600;
+
+$(document).ready(function() {
+    // Start the meaning lookup on the server while the user is still typing,
+    // but not for intermediate IME composition strings
+    $('#word').on('input', function(e) {
+        if (e.originalEvent && e.originalEvent.isComposing) {
+            return;
+        }
+        schedulePrefetch($(this).val().trim());
+    });
+    
+    $('#word').on('compositionend', function() {
+        schedulePrefetch($(this).val().trim());
+    });
+    
+    $('#searchBtn').click(function() {
+        const word = $('#word').val().trim();
+        if (!word) {
+            alert('Por favor, digite uma palavra');
+            return;
+        }
+        
+        // Reset previous results
+        resetFormPartial();
+        
+        // Check if word already exists
+        $.ajax({
+            url: '/api/check-word',
+            method: 'POST',
+            contentType: 'application/json',
+            data: JSON.stringify({word: word, lookup_token: lookupToken}),
+            success: function(response) {
+                if (response.exists) {
+                    $('#result').html('<div class="alert alert-error">Palavra já cadastrada!</div>').show();
+                    return;
+                }
+                rememberLookup(word, response.lookup_token);
+                searchMeanings(word);
+            },
+            error: function() {
+                $('#result').html('<div class="alert alert-error">Erro ao verificar palavra</div>').show();
+            }
+        });
+    });
+    
+    $('#loadMoreBtn').click(function() {
+        const word = $('#word').val().trim();
+        loadMoreMeanings(word);
+    });
+    
+    $('#saveBtn').click(function() {
+        if (selectedMeaning === null) {
+            alert('Por favor, selecione um significado');
+            return;
+        }
+        
+        const word = $('#word').val().trim();
+        const useKanji = $('#useKanji').is(':checked');
+        const customTranslation = $('#customTranslation').val().trim();
+        
+        $('#audioGeneration').show();
+        $('#saveBtn').prop('disabled', true);
+        
+        $.ajax({
+            url: '/api/save-word',
+            method: 'POST',
+            contentType: 'application/json',
+            data: JSON.stringify({
+                word: word,
+                meaning_index: selectedMeaning,
+                use_kanji: useKanji,
+                custom_translation: customTranslation,
+                lookup_token: tokenFor(word)
+            }),
+            success: function(response) {
+                $('#audioGeneration').hide();
+                $('#result').html('<div class="alert alert-success">Palavra adicionada com sucesso!</div>').show();
+                
+                // Reset all form fields and variables
+                resetForm();
+            },
+            error: function(xhr) {
+                $('#audioGeneration').hide();
+                $('#saveBtn').prop('disabled', false);
+                const error = xhr.responseJSON ? xhr.responseJSON.error : 'Erro desconhecido';
+                $('#result').html(`<div class="alert alert-error">Erro ao salvar: ${error}</div>`).show();
+            }
+        });
+    });
+});
+
+function schedulePrefetch(word) {
+    clearTimeout(typingTimer);
+    if (!word) {
+        return;
+    }
+    typingTimer = setTimeout(function() {
+        prefetchMeanings(word);
+    }, PREFETCH_DELAY);
+}
+
+function prefetchMeanings(word) {
+    // Sending the previous token lets the server drop the lookup this one replaces
+    $.ajax({
+        url: '/api/check-word',
+        method: 'POST',
+        contentType: 'application/json',
+        data: JSON.stringify({word: word, lookup_token: lookupToken}),
+        success: function(response) {
+            if (!response.exists) {
+                rememberLookup(word, response.lookup_token);
+            }
+        }
+    });
+}
+
+function rememberLookup(word, token) {
+    if (token) {
+        lookupWord = word;
+        lookupToken = token;
+    }
+}
+
+function tokenFor(word) {
+    return word === lookupWord ? lookupToken : null;
+}
+
+function searchMeanings(word, loadMore = false) {
+    $('#loading').show();
+    $('#meanings').hide();
+    $('#result').hide();
+    
+    $.ajax({
+        url: '/api/get-meanings',
+        method: 'POST',
+        contentType: 'application/json',
+        data: JSON.stringify({
+            word: word,
+            load_more: loadMore,
+            lookup_token: tokenFor(word)
+        }),
+        success: function(response) {
+            $('#loading').hide();
+            rememberLookup(word, response.lookup_token);
+            meanings = response.meanings;
+            
+            if (meanings.length === 0) {
+                $('#result').html('<div class="alert alert-error">Nenhum significado encontrado</div>').show();
+                return;
+            }
+            
+            displayMeanings(meanings);
+            
+            // Show/hide load more button
+            if (response.has_more && !loadMore) {
+                $('#loadMoreBtn').show();
+            } else {
+                $('#loadMoreBtn').hide();
+            }
+        },
+        error: function() {
+            $('#loading').hide();
+            $('#result').html('<div class="alert alert-error">Erro ao buscar significados</div>').show();
+        }
+    });
+}
+
+function loadMoreMeanings(word) {
+    $('#loadMoreBtn').prop('disabled', true).text('🔄 Carregando...');
+    searchMeanings(word, true);
+}
+
+function displayMeanings(meanings) {
+    const meaningsList = $('#meaningsList');
+    meaningsList.empty();
+    
+    meanings.forEach(function(meaning, index) {
+        const meaningHtml = `
+            <div class="meaning-option" data-index="${index}">
+                <strong>${meaning.level}</strong> | 
+                <span style="font-size: 1.2em;">${meaning.furigana}</span> | 
+                <span style="font-size: 1.2em;">${meaning.kanji}</span><br>
+                <span style="color: #666;">${meaning.text}</span>
+            </div>
+        `;
+        meaningsList.append(meaningHtml);
+    });
+    
+    $('.meaning-option').click(function() {
+        $('.meaning-option').removeClass('selected');
+        $(this).addClass('selected');
+        selectedMeaning = parseInt($(this).data('index'));
+        $('#saveBtn').show();
+    });
+    
+    $('#meanings').show();
+}
+
+function resetForm() {
+    // Reset form fields
+    $('#word').val('');
+    $('#customTranslation').val('');
+    $('#useKanji').prop('checked', false);
+    
+    // Reset variables
+    selectedMeaning = null;
+    meanings = [];
+    lookupToken = null;
+    lookupWord = null;
+    clearTimeout(typingTimer);
+    
+    // Hide sections
+    $('#meanings').hide();
+    $('#saveBtn').hide().prop('disabled', false);
+    $('#audioGeneration').hide();
+    $('#result').hide();
+    
+    // Clear meaning options click handlers
+    $('.meaning-option').off('click');
+    
+    // Enable save button and reset text
+    $('#saveBtn').text('💾 Salvar Palavra');
+}
+
+function resetFormPartial() {
+    // Reset only search results, keep the word input
+    $('#customTranslation').val('');
+    $('#useKanji').prop('checked', false);
+    
+    // Reset variables
+    selectedMeaning = null;
+    meanings = [];
+    
+    // Hide sections
+    $('#meanings').hide();
+    $('#saveBtn').hide().prop('disabled', false);
+    $('#audioGeneration').hide();
+    $('#result').hide();
+    
+    // Clear meaning options click handlers
+    $('.meaning-option').off('click');
+    
+    // Enable save button and reset text
+    $('#saveBtn').text('💾 Salvar Palavra');
+}
@@ -0,0 +1,24 @@
+// Check API configuration status
+$(document).ready(function() {
+    $.get('/api/status')
+        .done(function(data) {
+            $('#configStatus').show();
+
+            // Speech Status
+            if (data.azure_speech) {
+                $('#speechStatus span').text('Configurado').addClass('status-ok');
+            } else {
+                $('#speechStatus span').text('Não configurado').addClass('status-error');
+            }
+
+            // Translator Status  
+            if (data.azure_translator) {
+                $('#translatorStatus span').text('Configurado').addClass('status-ok');
+            } else {
+                $('#translatorStatus span').text('Não configurado').addClass('status-error');
+            }
+        })
+        .fail(function() {
+            console.log('Erro ao verificar status das configurações');
+        });
+});
@@ -0,0 +1,245 @@
+let currentPage = 1;
+let currentSearch = '';
+let editingWordId = null;
+
+$(document).ready(function() {
+    loadWords();
+    
+    $('#searchBtn').click(function() {
+        currentSearch = $('#searchInput').val().trim();
+        currentPage = 1;
+        loadWords();
+    });
+    
+    $('#searchInput').keypress(function(e) {
+        if (e.which === 13) { // Enter key
+            $('#searchBtn').click();
+        }
+    });
+    
+    $('#refreshBtn').click(function() {
+        currentSearch = '';
+        currentPage = 1;
+        $('#searchInput').val('');
+        loadWords();
+    });
+    
+    // Edit modal handlers
+    $('#cancelEditBtn').click(function() {
+        closeEditModal();
+    });
+    
+    $('#saveEditBtn').click(function() {
+        saveWordEdit();
+    });
+    
+    // Close modal when clicking outside
+    $('#editModal').click(function(e) {
+        if (e.target === this) {
+            closeEditModal();
+        }
+    });
+});
+
+function loadWords(page = 1) {
+    currentPage = page;
+    
+    $('#loading').show();
+    $('#wordsTable').hide();
+    $('#noWords').hide();
+    
+    const params = new URLSearchParams({
+        page: page,
+        per_page: 10,
+        search: currentSearch
+    });
+    
+    $.get(`/api/words?${params}`)
+        .done(function(data) {
+            $('#loading').hide();
+            
+            if (data.words.length === 0) {
+                $('#noWords').show();
+                $('#totalWords').text('0');
+                return;
+            }
+            
+            $('#wordsTable').show();
+            $('#totalWords').text(data.total);
+            
+            renderWordsTable(data.words);
+            renderPagination(data);
+        })
+        .fail(function() {
+            $('#loading').hide();
+            alert('Erro ao carregar palavras');
+        });
+}
+
+function renderWordsTable(words) {
+    const tbody = $('#wordsTableBody');
+    tbody.empty();
+    
+    words.forEach(function(word) {
+        const audioIndicators = `
+            <div class="audio-indicators">
+                <span class="audio-indicator ${word.has_audio1 ? 'has-audio' : 'no-audio'}" title="Áudio 1"></span>
+                <span class="audio-indicator ${word.has_audio2 ? 'has-audio' : 'no-audio'}" title="Áudio 2"></span>
+                <span class="audio-indicator ${word.has_audio3 ? 'has-audio' : 'no-audio'}" title="Áudio 3"></span>
+            </div>
+        `;
+        
+        const actions = `
+            <div class="action-buttons">
+                <button class="action-btn btn-play" onclick="playWordAudio(${word.id})" title="Reproduzir">▶️</button>
+                <button class="action-btn btn-edit" onclick="editWord(${word.id})" title="Editar">✏️</button>
+                <button class="action-btn btn-audio" onclick="regenerateAudio(${word.id})" title="Regenerar Áudio">🔊</button>
+                <button class="action-btn btn-delete" onclick="deleteWord(${word.id}, '${word.word}')" title="Excluir">🗑️</button>
+            </div>
+        `;
+        
+        const row = `
+            <tr>
+                <td>${word.id}</td>
+                <td style="font-size: 1.2em; font-weight: bold;">${word.word}</td>
+                <td style="font-size: 1.1em;">${word.kanji || '-'}</td>
+                <td><span class="badge">${word.level}</span></td>
+                <td style="max-width: 200px; word-wrap: break-word;">${word.meaning}</td>
+                <td>${audioIndicators}</td>
+                <td>${actions}</td>
+            </tr>
+        `;
+        
+        tbody.append(row);
+    });
+}
+
+function renderPagination(data) {
+    const pagination = $('#pagination');
+    pagination.empty();
+    
+    if (data.pages <= 1) return;
+    
+    // Previous button
+    const prevDisabled = data.page === 1 ? 'disabled' : '';
+    pagination.append(`<button class="pagination-btn ${prevDisabled}" onclick="loadWords(${data.page - 1})">‹ Anterior</button>`);
+    
+    // Page numbers
+    for (let i = 1; i <= data.pages; i++) {
+        const active = i === data.page ? 'active' : '';
+        pagination.append(`<button class="pagination-btn ${active}" onclick="loadWords(${i})">${i}</button>`);
+    }
+    
+    // Next button
+    const nextDisabled = data.page === data.pages ? 'disabled' : '';
+    pagination.append(`<button class="pagination-btn ${nextDisabled}" onclick="loadWords(${data.page + 1})">Próximo ›</button>`);
+}
+
+function playWordAudio(wordId) {
+    // Try to play audio 2 first, then 3 if 2 fails
+    const audio2 = new Audio(`/api/audio/${wordId}/2`);
+    audio2.onerror = function() {
+        const audio3 = new Audio(`/api/audio/${wordId}/3`);
+        audio3.play().catch(function() {
+            alert('Não foi possível reproduzir o áudio para esta palavra');
+        });
+    };
+    audio2.play().catch(function() {
+        // Try audio 3 if audio 2 fails
+        const audio3 = new Audio(`/api/audio/${wordId}/3`);
+        audio3.play().catch(function() {
+            alert('Não foi possível reproduzir o áudio para esta palavra');
+        });
+    });
+}
+
+function editWord(wordId) {
+    editingWordId = wordId;
+    
+    $.get(`/api/words/${wordId}`)
+        .done(function(word) {
+            $('#editWord').val(word.word);
+            $('#editKanji').val(word.kanji || '');
+            $('#editLevel').val(word.level);
+            $('#editMeaning').val(word.meaning);
+            $('#editModal').show();
+        })
+        .fail(function() {
+            alert('Erro ao carregar dados da palavra');
+        });
+}
+
+function closeEditModal() {
+    $('#editModal').hide();
+    editingWordId = null;
+}
+
+function saveWordEdit() {
+    if (!editingWordId) return;
+    
+    const data = {
+        kanji: $('#editKanji').val().trim(),
+        level: $('#editLevel').val(),
+        meaning: $('#editMeaning').val().trim()
+    };
+    
+    $.ajax({
+        url: `/api/words/${editingWordId}`,
+        method: 'PUT',
+        contentType: 'application/json',
+        data: JSON.stringify(data),
+        success: function() {
+            closeEditModal();
+            loadWords(currentPage);
+            alert('Palavra atualizada com sucesso!');
+        },
+        error: function() {
+            alert('Erro ao atualizar palavra');
+        }
+    });
+}
+
+function deleteWord(wordId, wordText) {
+    if (!confirm(`Tem certeza que deseja excluir a palavra "${wordText}"?\n\nEsta ação não pode ser desfeita e removerá todos os dados relacionados (sessões, tentativas, etc.).`)) {
+        return;
+    }
+    
+    $.ajax({
+        url: `/api/words/${wordId}`,
+        method: 'DELETE',
+        success: function(response) {
+            alert(response.message);
+            
+            // Reload current page or go to previous if this was the last item
+            loadWords(currentPage);
+        },
+        error: function(xhr) {
+            const error = xhr.responseJSON ? xhr.responseJSON.error : 'Erro desconhecido';
+            alert(`Erro ao excluir palavra: ${error}`);
+        }
+    });
+}
+
+function regenerateAudio(wordId) {
+    if (!confirm('Deseja regenerar o áudio para esta palavra?')) {
+        return;
+    }
+    
+    const useKanji = confirm('Usar kanji para gerar o áudio?\n\nClique "OK" para usar kanji ou "Cancelar" para usar hiragana/katakana.');
+    
+    $.ajax({
+        url: `/api/words/${wordId}/regenerate-audio`,
+        method: 'POST',
+        contentType: 'application/json',
+        data: JSON.stringify({use_kanji: useKanji}),
+        success: function(response) {
+            alert(response.message);
+            loadWords(currentPage);
+        },
+        error: function(xhr) {
+            const error = xhr.responseJSON ? xhr.responseJSON.error : 'Erro desconhecido';
+            const details = xhr.responseJSON ? xhr.responseJSON.details : '';
+            alert(`Erro ao regenerar áudio: ${error}${details ? '\n\n' + details : ''}`);
+        }
+    });
+}
@@ -0,0 +1,278 @@
+let currentSession = null;
+let words = [];
+let currentWordIndex = 0;
+let wordOffset = 0;
+let totalWords = 0;
+let interval = 5;
+let wordAnswer = null;
+let meaningAnswer = null;
+
+const SESSION_STORAGE_KEY = 'kakitoriSession';
+
+$(document).ready(function() {
+    // Resume an unfinished session after a page reload
+    const savedSession = localStorage.getItem(SESSION_STORAGE_KEY);
+    if (savedSession) {
+        resumePractice(savedSession);
+    }
+    
+    $('#sessionId').on('input', function() {
+        const hasSessionId = $(this).val().trim() !== '';
+        $('#wordCountGroup').toggle(!hasSessionId);
+    });
+    
+    $('#startBtn').click(function() {
+        const sessionId = $('#sessionId').val().trim();
+        const wordCount = parseInt($('#wordCount').val()) || 5;
+        interval = parseInt($('#interval').val()) || 5;
+        
+        startPractice(sessionId || null, wordCount);
+    });
+    
+    $('#playAudio').click(function() {
+        playCurrentAudio();
+    });
+    
+    $('#wordCorrect').click(function() {
+        wordAnswer = true;
+        checkAnswersComplete();
+    });
+    
+    $('#wordIncorrect').click(function() {
+        wordAnswer = false;
+        checkAnswersComplete();
+    });
+    
+    $('#meaningCorrect').click(function() {
+        meaningAnswer = true;
+        checkAnswersComplete();
+    });
+    
+    $('#meaningIncorrect').click(function() {
+        meaningAnswer = false;
+        checkAnswersComplete();
+    });
+    
+    $('#nextBtn').click(function() {
+        nextWord();
+    });
+    
+    $('#repeatBtn').click(function() {
+        repeatSession(false);
+    });
+    
+    $('#errorsOnlyBtn').click(function() {
+        repeatSession(true);
+    });
+    
+    $('#newSessionBtn').click(function() {
+        resetToSetup();
+    });
+});
+
+function startPractice(sessionId, wordCount, onlyErrors = false) {
+    $('#startBtn').prop('disabled', true).text('Carregando...');
+    
+    $.ajax({
+        url: '/api/start-practice',
+        method: 'POST',
+        contentType: 'application/json',
+        data: JSON.stringify({
+            session_id: sessionId,
+            word_count: wordCount,
+            only_errors: onlyErrors
+        }),
+        success: function(response) {
+            beginSession(response);
+            $('#sessionDetails').text(`Sessão ${currentSession} com ${totalWords} palavras`);
+        },
+        error: function(xhr) {
+            $('#startBtn').prop('disabled', false).text('🎯 Começar Prática');
+            const error = xhr.responseJSON ? xhr.responseJSON.error : 'Erro desconhecido';
+            alert(`Erro ao iniciar prática: ${error}`);
+        }
+    });
+}
+
+function resumePractice(sessionId) {
+    $.ajax({
+        url: `/api/resume-practice/${sessionId}`,
+        method: 'GET',
+        success: function(response) {
+            if (response.words.length === 0) {
+                localStorage.removeItem(SESSION_STORAGE_KEY);
+                return;
+            }
+            beginSession(response);
+            $('#sessionDetails').text(`Sessão ${currentSession} retomada na palavra ${wordOffset + 1} de ${totalWords}`);
+        },
+        error: function() {
+            localStorage.removeItem(SESSION_STORAGE_KEY);
+        }
+    });
+}
+
+function beginSession(response) {
+    currentSession = response.session_id;
+    words = response.words;
+    currentWordIndex = 0;
+    wordOffset = response.cursor;
+    totalWords = response.total;
+    localStorage.setItem(SESSION_STORAGE_KEY, currentSession);
+    
+    $('#setupCard').hide();
+    $('#practiceCard').show();
+    $('#totalWords').text(totalWords);
+    
+    startCurrentWord();
+}
+
+function startCurrentWord() {
+    if (currentWordIndex >= words.length) {
+        finishSession();
+        return;
+    }
+    
+    const word = words[currentWordIndex];
+    wordAnswer = null;
+    meaningAnswer = null;
+    
+    // Update progress
+    const position = wordOffset + currentWordIndex + 1;
+    const progress = (position / totalWords) * 100;
+    $('#progressFill').css('width', progress + '%');
+    $('#wordNumber').text(position);
+    
+    // Hide word display initially
+    $('#wordDisplay').hide();
+    
+    // Play audio sequence
+    playAudioSequence(word.id);
+}
+
+function playAudioSequence(wordId) {
+    // Play audio2, wait, play audio3, wait, play audio3 again, then show word
+    playAudio(wordId, 2, function() {
+        setTimeout(function() {
+            playAudio(wordId, 3, function() {
+                setTimeout(function() {
+                    playAudio(wordId, 3, function() {
+                        showWordDisplay();
+                    });
+                }, interval * 1000);
+            });
+        }, interval * 1000);
+    });
+}
+
+function playAudio(wordId, audioNum, callback) {
+    const audio = new Audio(`/api/audio/${wordId}/${audioNum}`);
+    
+    audio.onerror = function() {
+        console.log(`❌ Erro ao reproduzir áudio ${audioNum} para palavra ID ${wordId}`);
+        if (callback) callback();
+    };
+    
+    audio.onloadstart = function() {
+        console.log(`🔊 Carregando áudio ${audioNum} para palavra ID ${wordId}`);
+    };
+    
+    audio.oncanplay = function() {
+        console.log(`✅ Reproduzindo áudio ${audioNum} para palavra ID ${wordId}`);
+        audio.play().catch(function(error) {
+            console.log(`❌ Erro na reprodução: ${error}`);
+            if (callback) callback();
+        });
+    };
+    
+    if (callback) {
+        audio.onended = callback;
+    }
+}
+
+function playCurrentAudio() {
+    const word = words[currentWordIndex];
+    playAudio(word.id, 3);
+}
+
+function showWordDisplay() {
+    const word = words[currentWordIndex];
+    $('#wordText').text(word.word);
+    $('#meaningText').text(word.meaning);
+    $('#wordDisplay').show();
+}
+
+function checkAnswersComplete() {
+    if (wordAnswer !== null && meaningAnswer !== null) {
+        // Submit attempt
+        const word = words[currentWordIndex];
+        $.ajax({
+            url: '/api/submit-attempt',
+            method: 'POST',
+            contentType: 'application/json',
+            data: JSON.stringify({
+                session_id: currentSession,
+                word_id: word.id,
+                writing_correct: wordAnswer,
+                meaning_correct: meaningAnswer
+            }),
+            success: function() {
+                $('#answerButtons').show();
+            }
+        });
+    }
+}
+
+function nextWord() {
+    currentWordIndex++;
+    startCurrentWord();
+}
+
+function finishSession() {
+    $('#practiceCard').hide();
+    localStorage.removeItem(SESSION_STORAGE_KEY);
+    
+    // Get session score
+    $.ajax({
+        url: `/api/session-score/${currentSession}`,
+        method: 'GET',
+        success: function(response) {
+            $('#scoreDisplay').html(`
+                <strong>Pontuação Final</strong><br>
+                ${response.score} / 10
+            `);
+            
+            if (response.score < 10) {
+                $('#errorsOnlyBtn').show();
+            }
+            
+            $('#resultsCard').show();
+        }
+    });
+}
+
+function repeatSession(errorsOnly) {
+    const sessionId = currentSession;
+    const wordCount = words.length;
+    
+    $('#resultsCard').hide();
+    $('#errorsOnlyBtn').hide();
+    startPractice(sessionId, wordCount, errorsOnly);
+}
+
+function resetToSetup() {
+    $('#resultsCard').hide();
+    $('#practiceCard').hide();
+    $('#setupCard').show();
+    $('#startBtn').prop('disabled', false).text('🎯 Começar Prática');
+    $('#sessionId').val('');
+    $('#wordCount').val(5);
+    $('#wordCountGroup').show();
+    $('#errorsOnlyBtn').hide();
+    localStorage.removeItem(SESSION_STORAGE_KEY);
+    currentSession = null;
+    words = [];
+    currentWordIndex = 0;
+    wordOffset = 0;
+    totalWords = 0;
+}